@@ -18,24 +18,49 @@ Required Environment Variables are in the .env.example file. You can modify it t
 
 # 'os' lets us read environment variables (like passwords stored securely in AWS)
 import os
-# 'smtplib' is Python's built-in library for sending emails via SMTP protocol
-import smtplib
+# 'functools' gives us lru_cache, which remembers a function's results so we only look things up once
+import functools
 # 'logging' helps us print debug messages that show up in AWS CloudWatch logs...very helpful if you are building your own version of this project.
 import logging
+# 'time' gives us a monotonic clock for respecting GitHub's X-Poll-Interval
+import time
+# OrderedDict is a dict that remembers insertion order, used for the small email cache below
+from collections import OrderedDict
 from datetime import datetime, timezone
+# Imported as 'dtime' so it doesn't clash with the 'time' module above
+from datetime import time as dtime
 
-# These two imports help us create nicely formatted emails with HTML
-# MIMEText creates the email body, MIMEMultipart combines multiple formats # Found this on google and a youtube video. Helped a ton with formatting.
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+# The email imports (smtplib, email.mime.*) live inside the email functions further down.
+# Importing them only when we actually send something keeps cold starts shorter. After the first import
+# Python keeps them in sys.modules, so warm invocations don't pay for them again.
 
 # 'requests' for making HTTP requests (calling APIs)
 # We use it to call GitHub's API
 import requests
+# HTTPAdapter lets us tune the connection pool, Retry tells it to quietly retry GitHub's occasional 5xx hiccups
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# 'pytz' handles timezone conversions properly..PYthon Time Zone
+# 'orjson' is a JSON parser written in Rust. It turns GitHub's event pages into Python lists/dicts a lot faster
+# than requests' built-in response.json(), which uses the pure-Python-heavy stdlib json module
+import orjson
+
+# 'zoneinfo' handles timezone conversions properly, and it's built into Python 3.9+. It needs timezone data though:
+# it uses the system's /usr/share/zoneinfo if there is one, otherwise the 'tzdata' package we ship in requirements.txt
 # Important because GitHub uses UTC but we want Australian time
-import pytz
+from zoneinfo import ZoneInfo
+
+# Look up the Australian timezone once when the module loads. Lambda keeps module globals between warm invocations,
+# so every call after the first one reuses this object instead of building it again.
+AUS_TZ = ZoneInfo('Australia/Sydney')
+
+# The daily check window in Australian time: 00:01 to 18:30. You can modify this window,
+# the logs and emails below show whatever times are set here.
+WINDOW_START = dtime(0, 1)
+WINDOW_END = dtime(18, 30)
+# The same times as "HH:MM" text, for logs and emails
+WINDOW_START_TEXT = WINDOW_START.strftime("%H:%M")
+WINDOW_END_TEXT = WINDOW_END.strftime("%H:%M")
 
 # Create a logger, this sends messages to AWS CloudWatch so we can debug issues...hopefully you face none. Ever.
 # It's like print but with timestamps and log levels
@@ -44,14 +69,75 @@ logger = logging.getLogger()
 # INFO level means we'll see informational messages (not just errors)
 # Level: DEBUG < INFO < WARNING < ERROR < CRITICAL.
 logger.setLevel(logging.INFO)
+
+# One shared HTTP session for every GitHub call. The session keeps the connection to api.github.com open (keep-alive),
+# so extra pages don't pay for a new TCP + TLS handshake. Lambda keeps this module loaded between warm invocations,
+# so the open connection gets reused across days too.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    # Telling GitHub we want JSON in their v3 API format..
+    "Accept": "application/vnd.github.v3+json",
+    # GitHub asks every API client to send a User-Agent
+    "User-Agent": "streak-monitor",
+})
+# We only ever talk to one host, so one pooled connection is all we need. Retries go through the same pool,
+# which means a retried request reuses the open connection instead of doing a fresh handshake.
+# Retries are for GitHub answering with a 5xx. If GitHub doesn't answer at all we give up quickly instead,
+# so the whole run (including the email) still fits in the 30 second Lambda timeout.
+_SESSION.mount("https://api.github.com", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(
+        total=3,
+        # One more try if we couldn't connect, none if the connection went quiet mid-request
+        connect=1,
+        read=0,
+        status=3,
+        # Waits 0s, 0.6s, 1.2s between attempts
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=("GET",),
+        # Don't sleep for however long a Retry-After header asks, stick to the short backoff above
+        respect_retry_after_header=False,
+    ),
+))
+
+# GitHub's Events API supports conditional requests. We remember the ETag and the parsed events for each page we fetched,
+# keyed by (url, page). Next time we send If-None-Match, and if nothing changed GitHub answers 304 Not Modified with no body,
+# which is cheap and doesn't count against the rate limit. Like _SESSION, these survive between warm invocations.
+_ETAGS = {}
+_EVENTS_CACHE = {}
+# GitHub also tells us how often we're allowed to poll (X-Poll-Interval, in seconds). This maps (url, page) to the
+# time.monotonic() value before which we just reuse the cached page instead of asking again.
+_NEXT_POLL = {}
+
+# Encoded email messages we've already built, keyed by (sender, recipient, has_commit, date_str).
+# If the function runs again on the same day in a warm container (e.g. a retry), we skip rebuilding the MIME message.
+# An OrderedDict remembers insertion order, so we can throw away the oldest entry once there are more than 7.
+_MIME_CACHE = OrderedDict()
+
+# The logged-in SMTP connection, kept between warm invocations so we don't redo connect + STARTTLS + login every time.
+# None means "not connected yet". See _get_smtp() below.
+_SMTP_CLIENT = None
+
+@functools.lru_cache(maxsize=None)
+def _read_env(key):
+    """
+    Read an environment variable once and remember it.
+    Lambda's environment variables can't change inside a running container (changing them starts new containers),
+    so warm invocations can reuse what we read the first time.
+    """
+    # os.environ.get() returns the value of the environment variable, If it doesn't exist, it returns None
+    return os.environ.get(key)
+
+
 def get_env(key, required=True):
     """
     Safely get an environment variable.
     Environment variables are like secret settings stored outside the code.
     In AWS Lambda, you set these in the console under "Configuration > Environment variables". DO NOT MISS THIS.
     """
-    # os.environ.get() returns the value of the environment variable, If it doesn't exist, it returns None
-    value = os.environ.get(key)
+    value = _read_env(key)
     # If it's missing, raise an error with a helpful message
     if required and not value:
         raise ValueError(f"Missing the required environment variable: {key}")
@@ -59,6 +145,65 @@ def get_env(key, required=True):
 
 # GITHUB API FUNCTION
 
+def _fetch_events_page(url, headers, page, per_page):
+    """
+    Fetch one page of events, using the cached copy when GitHub says nothing changed.
+    Sends If-None-Match with the ETag from last time. A 304 means our cached events are still current.
+    Each event is boiled down to a (type, created_at) pair, the only two fields we look at.
+    Returns (events, rate_limit_remaining). rate_limit_remaining is None when GitHub didn't tell us (or we didn't ask).
+    Raises on HTTP errors, just like calling the API directly would.
+    """
+    key = (url, page)
+
+    # Still inside the poll interval GitHub gave us last time, so don't even ask
+    if key in _EVENTS_CACHE and time.monotonic() < _NEXT_POLL.get(key, 0):
+        return _EVENTS_CACHE[key], None
+
+    # Copy so the caller's headers dict doesn't pick up If-None-Match for other pages
+    request_headers = dict(headers)
+    if key in _ETAGS and key in _EVENTS_CACHE:
+        request_headers["If-None-Match"] = _ETAGS[key]
+
+    # Make the HTTP GET request to GitHub's API. Give up if connecting takes more than 3 seconds
+    # or GitHub goes quiet for more than 10 seconds while answering.
+    response = _SESSION.get(
+        url, headers=request_headers, params={"page": page, "per_page": per_page}, timeout=(3, 10)
+    )
+
+    # Raise an exception if the request failed (304 is not an error, so it passes through)
+    response.raise_for_status()
+
+    # How many API calls we have left this hour
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    remaining = int(remaining) if remaining and remaining.isdigit() else None
+
+    poll_interval = response.headers.get("X-Poll-Interval")
+    if poll_interval and poll_interval.isdigit():
+        _NEXT_POLL[key] = time.monotonic() + int(poll_interval)
+
+    if response.status_code == 304:
+        # Nothing changed since last time, reuse what we parsed before
+        return _EVENTS_CACHE[key], remaining
+
+    # Parse the JSON response into a Python list of dictionaries...again, this is how we get the data from the API.
+    # orjson.loads() takes the raw bytes directly, no need to decode them to a string first.
+    # Each event is a big nested dict (actor, repo, payload, ...), but we only need two fields, so keep just those
+    # and let the rest be freed straight away. That's also what ends up in _EVENTS_CACHE between invocations.
+    # .get() is safer than ['type'] - it returns None if key doesn't exist
+    events = [(event.get("type"), event["created_at"]) for event in orjson.loads(response.content)]
+
+    etag = response.headers.get("ETag")
+    if etag:
+        _ETAGS[key] = etag
+        _EVENTS_CACHE[key] = events
+    else:
+        # No ETag means we can't revalidate this page, so drop anything stale
+        _ETAGS.pop(key, None)
+        _EVENTS_CACHE.pop(key, None)
+
+    return events, remaining
+
+
 def check_commits_today(username, token):
     """
     Check if the user has made any commits today (Australian time).
@@ -67,157 +212,340 @@ def check_commits_today(username, token):
     modify this to make it lineant and inclue pull requests, issues, etc.
     
     How GitHub's Events API works: https://api.github.com/users/{username}/events.
-    Returns up to 300 events (paginated, 100 per page). Events include: PushEvent, CreateEvent, IssueCommentEvent, etc.
+    Returns up to 300 events (paginated). We ask for 30 per page and read at most 2 pages, because the events come
+    newest first and page 1 almost always reaches back past the start of the window already. Events include: PushEvent, CreateEvent, IssueCommentEvent, etc.
     We only care about PushEvent (which represents commits).
+
+    Returns True if there's at least one commit in today's window, False otherwise.
+    Events come newest first, so we stop at the first PushEvent inside the window instead of reading every page.
     """
     
     # Set up Australian timezone (very painful debugging which I didn't realise until very later on before asking this on Stack Overflow)
-
-    aus_tz = pytz.timezone('Australia/Sydney')
+    # The timezone object itself is built once at module load, see AUS_TZ above
+    aus_tz = AUS_TZ
     now_aus = datetime.now(aus_tz)
     today_aus = now_aus.date()
-    # We are creating a time object for 00:01 and 18:30, because we want to check for commits between 00:01 and 18:30 Australian time. You can modify this window.
-    check_start_aus = aus_tz.localize(
-        datetime.combine(today_aus, datetime(1900, 1, 1, 0, 1).time())
-    )
-    check_end_aus = aus_tz.localize(
-        datetime.combine(today_aus, datetime(1900, 1, 1, 18, 30).time())
-    )
+    # We want to check for commits between WINDOW_START and WINDOW_END Australian time (00:01 and 18:30 unless you changed them)
+    # With zoneinfo we can pass tzinfo straight to combine(), no localize() step needed
+    check_start_aus = datetime.combine(today_aus, WINDOW_START, tzinfo=aus_tz)
+    check_end_aus = datetime.combine(today_aus, WINDOW_END, tzinfo=aus_tz)
     
     # Convert to UTC for comparison with GitHub timestamps
     check_start_utc = check_start_aus.astimezone(timezone.utc)
     check_end_utc = check_end_aus.astimezone(timezone.utc)
 
+    # GitHub's created_at is always "YYYY-MM-DDTHH:MM:SSZ" in UTC. Timestamps in that exact format sort the same way
+    # alphabetically as they do in time, so we can compare the raw strings instead of parsing every event into a datetime.
+    check_start_iso = check_start_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+    check_end_iso = check_end_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+
     # Log what we're doing (these messages appear in AWS CloudWatch...I used this for debugging)
-    logger.info(f"Checking commits for {today_aus} between 00:01-18:30 AEDT")
-    logger.info(f"UTC range: {check_start_utc} to {check_end_utc}")
+    logger.info("Checking commits for %s between %s-%s AEDT", today_aus, WINDOW_START_TEXT, WINDOW_END_TEXT)
+    logger.info("UTC range: %s to %s", check_start_utc, check_end_utc)
 
     # Prepare the API request
     url = f"https://api.github.com/users/{username}/events"
     
-    # HTTP headers tell GitHub who we are and what format we want
+    # HTTP headers tell GitHub who we are. Accept and User-Agent already live on _SESSION.
     headers = {
         # Authorization header with our token - this authenticates us
         "Authorization": f"token {token}",
-        
-        # Telling GitHub we want JSON in their v3 API format..
-        "Accept": "application/vnd.github.v3+json"
     }
 
-    # Fetch events with pagination
-    all_events = []  # We'll collect all events here
+    # Fetch events page by page and check them as they arrive. GitHub returns newest events first,
+    # so the moment we see one PushEvent inside the window we can answer "yes" without fetching or looking at anything else.
+    total_events = 0  # How many events we've looked at, just for logging
     page = 1  # Start at page 1
+
+    # Per-event logs go out at DEBUG. At INFO every line would get shipped to CloudWatch, which costs time and money,
+    # so we check the level once here and skip building those messages entirely unless DEBUG is switched on.
+    debug = logger.isEnabledFor(logging.DEBUG)
     
-    while page <= 5:
-        params = {"page": page, "per_page": 100}
-        
+    # Two pages is only a safety net, normally page 1 already goes back further than our window
+    while page <= 2:
         try:
-            # Make the HTTP GET request to GitHub's API, give up if it takes more than 10 seconds
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            
-            # Raise an exception if the request failed
-            response.raise_for_status()
-            
-            # Parse the JSON response into a Python list of dictionaries...again, this is how we get the data from the API.
-            events = response.json()
+            # Conditional request: a 304 from GitHub hands back the events we parsed last time
+            events, rate_limit_remaining = _fetch_events_page(url, headers, page, 30)
             
         except Exception as e:
             # If anything goes wrong, log the error and stop fetching...this is how we handle errors.
-            logger.error(f"Failed to fetch events: {e}")
+            logger.error("Failed to fetch events: %s", e)
             break
 
         if not events:
             break
         
-        # Add this page's events to our collection...this is how we collect the data from the API.
-        all_events.extend(events)
-        logger.info(f"Page {page}: {len(events)} events (total: {len(all_events)})")
-        
+        total_events += len(events)
+        logger.info("Page %d: %d events (total: %d)", page, len(events), total_events)
+
         # Stop early if we've gone past our time window...this is how we optimize the function.
-        oldest_event_time = datetime.fromisoformat(
-            events[-1]["created_at"].replace("Z", "+00:00")
-        )
+        # Decide this before scanning the page: if the oldest event here is already before our window,
+        # page N+1 can't have anything for us, so this page is the last one we look at.
+        reached_window_start = events[-1][1] < check_start_iso
+
+        # ---------------------------------------------------------------------
+        # Filter this page for commits within our time window
+        # ---------------------------------------------------------------------
+        
+        for event_type, created_at in events:
+
+            # Everything after this is older still, so there's nothing left to find on this page (or the next ones)
+            if created_at < check_start_iso:
+                if debug:
+                    logger.debug("  -> Reached %s, before window, stopping", created_at)
+                break
+            
+            # We only care about "PushEvent" - this is when commits are pushed
+            # Other events like "IssueCommentEvent" or "WatchEvent" don't count
+            if event_type != "PushEvent":
+                continue  # Skip to the next event
+            
+            # Per-event logs are DEBUG only, and only built when DEBUG is switched on (see 'debug' above)
+            if debug:
+                logger.debug("PushEvent: %s", created_at)
+            
+            if created_at > check_end_iso:
+                # This commit is after our window (e.g., made after 6:30 PM)
+                if debug:
+                    logger.debug("  -> After %s, skipping", WINDOW_END_TEXT)
+                continue
+            
+            # This commit counts - one is all we need, so stop right here
+            if debug:
+                logger.debug("  -> Found commit in window!")
+            logger.info("Total events: %d", total_events)
+            logger.info("Found a commit today")
+            return True
         
         # If the oldest event is before our window, stop fetching...this is how we stop the function.
-        if oldest_event_time < check_start_utc:
+        if reached_window_start:
+            break
+
+        # Don't burn the last few API calls of the hour on extra pages
+        if rate_limit_remaining is not None and rate_limit_remaining < 10:
+            logger.warning("Only %d GitHub API calls left, not fetching more pages", rate_limit_remaining)
             break
         
         # Next page
         page += 1
 
-    logger.info(f"Total events: {len(all_events)}")
+    logger.info("Total events: %d", total_events)
+    logger.info("No commits found in check window")
+    # Return False (no commits)
+    return False
+
+
+# =============================================================================
+# EMAIL FUNCTION
+# =============================================================================
+
+# The email bodies are plain str.format_map templates instead of big f-strings rebuilt on every call.
+# When the module loads, each outcome's wording (the dicts below) gets baked into them by _specialize(),
+# so all that's left per email is filling in {date_str}.
+
+# This is the simple text version for email clients that don't support HTML
+# Triple quotes (""") allow multi-line strings in Python
+_TEXT_TEMPLATE = """GitHub Streak Monitor - Daily Status
+
+Date: {date_str}
+Status: {status}
+{status_text}
+
+{body_text}
+
+Check Window: {window_start} - {window_end} (Australian Eastern Time)
+
+{footer}
+"""
+
+# This is the fancy formatted version with colors and styling
+# Most modern email clients will display this version
+_HTML_TEMPLATE = """
+<html>
+<body>
+<h2>GitHub Streak Monitor - Daily Status</h2>
+<p><strong>Date:</strong> {date_str}</p>
+<p><strong>Status:</strong> <span style="color: {status_color}; font-weight: bold;">{status}</span></p>
+<p><strong>{status_text}</strong></p>
+<hr>
+<p>{body_text}</p>
+<p><strong>Check Window:</strong> {window_start} - {window_end} (Australian Eastern Time)</p>
+<p><em>{footer}</em></p>
+</body>
+</html>
+"""
+
+# SUCCESS: User made commits today
+_COMMIT_VARS = {
+    "subject": "GitHub Streak Monitor - You're Slaying ({date_str})",
+    "status": "FIRE",
+    "status_color": "#28a745",  # Green color (hex code)
+    "status_text": "Found a commit between {window_start} and {window_end}",
+    "body_text": (
+        "No cap, you're absolutely crushing it! "
+        "You pushed today. "
+        "That green dot is looking fresh."
+    ),
+    "footer": "Keep up the grind, you're doing amazing!",
+}
+
+# WARNING: No commits found today
+_NOCOMMIT_VARS = {
+    "subject": "GitHub Streak Monitor - We Need to Talk ({date_str})",
+    "status": "ALERT",
+    "status_color": "#dc3545",  # Red color (hex code)
+    "status_text": "No commits found between {window_start} and {window_end}",
+    "body_text": (
+        "Yikes, no commits detected today. "
+        "Your contribution streak is about to catch these hands if you don't commit something ASAP. "
+        "Don't let that green dot ghost you!"
+    ),
+    "footer": "Time to push something before it's too late. You got this!",
+}
+
+
+def _specialize(email_vars):
+    """
+    Fill one outcome's wording into the templates, leaving only {date_str} to fill in later.
+    Returns (subject, text, html) templates.
+    """
+    # Formatting a placeholder with itself leaves it in place for the second round
+    fixed = {"window_start": WINDOW_START_TEXT, "window_end": WINDOW_END_TEXT, "date_str": "{date_str}"}
+    # The short strings can mention the window too, so fill those in first
+    fields = {key: value.format_map(fixed) for key, value in email_vars.items()}
+    fields.update(fixed)
+    return (
+        fields["subject"],
+        _TEXT_TEMPLATE.format_map(fields),
+        _HTML_TEMPLATE.format_map(fields),
+    )
+
+
+# Both possible emails, prepared once when the module loads. Keyed by has_commit.
+_EMAIL_TEMPLATES = {
+    True: _specialize(_COMMIT_VARS),
+    False: _specialize(_NOCOMMIT_VARS),
+}
+
+
+def _get_smtp(smtp_server, smtp_port, sender, password, reconnect=False):
+    """
+    Return a logged-in SMTP connection, reusing the cached one if it still works.
+    NOOP is a tiny "are you there?" command. If the server answers 250 the old connection is fine,
+    otherwise (or if it already hung up on us) we open a fresh one.
+    """
+    # 'smtplib' is Python's built-in library for sending emails via SMTP protocol
+    import smtplib
+
+    global _SMTP_CLIENT
+
+    if _SMTP_CLIENT is not None and not reconnect:
+        # The function only runs once a day, so the old connection has usually been dropped as idle by now.
+        # Only give NOOP 2 seconds to answer instead of the full 10, then go back to 10 for the actual send.
+        sock = _SMTP_CLIENT.sock
+        try:
+            if sock is not None:
+                sock.settimeout(2)
+            if _SMTP_CLIENT.noop()[0] == 250:
+                sock.settimeout(10)
+                return _SMTP_CLIENT
+        except OSError:
+            # smtplib errors are OSErrors too, so this covers both "server hung up" and dead sockets
+            pass
+
+    # Close the old connection if there is one, ignoring errors since it's probably dead anyway
+    if _SMTP_CLIENT is not None:
+        try:
+            _SMTP_CLIENT.close()
+        except Exception:
+            pass
+        _SMTP_CLIENT = None
+
+    # smtplib.SMTP() opens a connection to the mail server. Give up after 10 seconds (same as the GitHub calls),
+    # otherwise a cached connection the network silently dropped overnight could leave noop() waiting forever.
+    server = smtplib.SMTP(smtp_server, int(smtp_port), timeout=10)
+
+    try:
+        # starttls() upgrades the connection to use encryption (TLS)
+        # This is important for security - it encrypts your password and email
+        server.starttls()
+
+        # login() authenticates with your email and password
+        # For Gmail, you MUST use an "App Password" (not your regular password)
+        server.login(sender, password)
+    except Exception:
+        # Don't leave a half-open connection lying around if TLS or login fails
+        server.close()
+        raise
+
+    _SMTP_CLIENT = server
+    return server
+
 
+def _build_message(sender, recipient, has_commit, date_str):
+    """
+    Build the status email (plaintext + HTML) and return it encoded, ready for sendmail().
+    send_email() caches the result, see _MIME_CACHE.
+    """
+
+    # Imported here rather than at the top of the file, see the note next to the imports
+    # These two imports help us create nicely formatted emails with HTML
+    # MIMEText creates the email body, MIMEMultipart combines multiple formats # Found this on google and a youtube video. Helped a ton with formatting.
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    
     # -------------------------------------------------------------------------
-    # STEP 6: Filter for commits within our time window
+    # STEP 1: Create the email message container
     # -------------------------------------------------------------------------
     
-    commits_today = []  # Will hold timestamps of commits we find
+    # MIMEMultipart("alternative") creates an email that can hold multiple versions
+    # "alternative" means: "here are different versions of the same content"
+    message = MIMEMultipart("alternative")
     
-    # Loop through all events we fetched
-    for event in all_events:
-        
-        # We only care about "PushEvent" - this is when commits are pushed
-        # Other events like "IssueCommentEvent" or "WatchEvent" don't count
-        # .get() is safer than ['type'] - it returns None if key doesn't exist
-        if event.get("type") != "PushEvent":
-            continue  # Skip to the next event
-        
-        # Parse the event timestamp from ISO 8601 format
-        event_time = datetime.fromisoformat(
-            event["created_at"].replace("Z", "+00:00")
-        )
-        
-        # Convert to Australian time for logging (easier to understand)
-        event_time_aus = event_time.astimezone(aus_tz)
-        
-        # Get the repository name for logging
-        # .get() with a default handles missing keys gracefully
-        repo_name = event.get('repo', {}).get('name', 'unknown')
-        
-        # Log each PushEvent we find
-        logger.info(
-            f"PushEvent: {event_time_aus.strftime('%Y-%m-%d %H:%M:%S %Z')} - {repo_name}"
-        )
-        
-        # Check if this commit falls within our time window
-        if check_start_utc <= event_time <= check_end_utc:
-            # This commit counts - it's within our window
-            logger.info(f"  -> Found commit in window!")
-            commits_today.append(event_time)
-            
-        elif event_time > check_end_utc:
-            # This commit is after our window (e.g., made after 6:30 PM)
-            logger.info(f"  -> After 18:30, skipping")
-            
-        else:
-            # This commit is before our window (e.g., from yesterday)
-            logger.info(f"  -> Before window or old")
+    # -------------------------------------------------------------------------
+    # STEP 2: Set up email content based on whether commits were found
+    # -------------------------------------------------------------------------
+    
+    # Pick the ready-made templates for today's result (see _EMAIL_TEMPLATES), then fill in the date
+    subject, text, html = _EMAIL_TEMPLATES[bool(has_commit)]
+    values = {"date_str": date_str}
+    
+    # -------------------------------------------------------------------------
+    # STEP 3: Set email headers
+    # -------------------------------------------------------------------------
+    
+    # These are standard email headers that every email needs
+    message["Subject"] = subject.format_map(values)  # The email subject line
+    message["From"] = sender                          # Who the email is from
+    message["To"] = recipient                         # Who the email is going to
 
     # -------------------------------------------------------------------------
-    # STEP 7: Return the results
+    # STEP 4 + 5: Fill in the plaintext and HTML versions of the email
     # -------------------------------------------------------------------------
     
-    if commits_today:
-        logger.info(f"Found {len(commits_today)} commit(s) today")
-        # Return True (commits found) and the list of commit times
-        return True, commits_today
-    else:
-        logger.info("No commits found in check window")
-        # Return False (no commits) and an empty list
-        return False, []
+    text = text.format_map(values)
+    html = html.format_map(values)
 
+    # -------------------------------------------------------------------------
+    # STEP 6: Attach both versions to the email
+    # -------------------------------------------------------------------------
+    
+    # MIMEText creates a text block that can be attached to an email
+    # The second argument specifies the content type
+    message.attach(MIMEText(text, "plain"))  # Plaintext version
+    message.attach(MIMEText(html, "html"))   # HTML version
+
+    # as_bytes() converts our MIME message to the format SMTP expects
+    return message.as_bytes()
 
-# =============================================================================
-# EMAIL FUNCTION
-# =============================================================================
 
-def send_email(smtp_server, smtp_port, sender, password, recipient, has_commit, commit_times, date_str):
+def send_email(smtp_server, smtp_port, sender, password, recipient, has_commit, date_str):
     """
     Send a status email about today's commit activity.
     
     This function:
-    1. Creates an email with both plaintext and HTML versions
-    2. Connects to the SMTP server (like Gmail)
+    1. Creates an email with both plaintext and HTML versions (or reuses it if this exact email was built before)
+    2. Connects to the SMTP server (like Gmail), or reuses the connection from a previous warm invocation
     3. Authenticates and sends the email
     
     Parameters:
@@ -227,7 +555,6 @@ def send_email(smtp_server, smtp_port, sender, password, recipient, has_commit,
         password (str): Password for the sender email (use App Password for Gmail)
         recipient (str): Email address to send to
         has_commit (bool): Whether commits were found today
-        commit_times (list): List of commit timestamps
         date_str (str): Today's date as a string (e.g., "2025-12-06")
     
     What is SMTP?
@@ -239,127 +566,40 @@ def send_email(smtp_server, smtp_port, sender, password, recipient, has_commit,
         Some email clients don't support HTML, so we include both versions.
         The email client will pick the best one it can display.
     """
-    
-    # Get Australian timezone (not used in this function but kept for consistency)
-    aus_tz = pytz.timezone('Australia/Sydney')
-    
-    # -------------------------------------------------------------------------
-    # STEP 1: Create the email message container
-    # -------------------------------------------------------------------------
-    
-    # MIMEMultipart("alternative") creates an email that can hold multiple versions
-    # "alternative" means: "here are different versions of the same content"
-    message = MIMEMultipart("alternative")
-    
-    # -------------------------------------------------------------------------
-    # STEP 2: Set up email content based on whether commits were found
-    # -------------------------------------------------------------------------
-    
-    if has_commit:
-        # SUCCESS: User made commits today
-        subject = f"GitHub Streak Monitor - You're Slaying ({date_str})"
-        status = "FIRE"
-        status_color = "#28a745"  # Green color (hex code)
-        status_text = f"Found {len(commit_times)} commit(s) between 00:01 and 18:30"
-        body_text = (
-            f"No cap, you're absolutely crushing it! "
-            f"You made {len(commit_times)} commit(s) today. "
-            f"That green dot is looking fresh."
-        )
-        footer = "Keep up the grind, you're doing amazing!"
-    else:
-        # WARNING: No commits found today
-        subject = f"GitHub Streak Monitor - We Need to Talk ({date_str})"
-        status = "ALERT"
-        status_color = "#dc3545"  # Red color (hex code)
-        status_text = "No commits found between 00:01 and 18:30"
-        body_text = (
-            "Yikes, no commits detected today. "
-            "Your contribution streak is about to catch these hands if you don't commit something ASAP. "
-            "Don't let that green dot ghost you!"
-        )
-        footer = "Time to push something before it's too late. You got this!"
-    
-    # -------------------------------------------------------------------------
-    # STEP 3: Set email headers
-    # -------------------------------------------------------------------------
-    
-    # These are standard email headers that every email needs
-    message["Subject"] = subject  # The email subject line
-    message["From"] = sender      # Who the email is from
-    message["To"] = recipient     # Who the email is going to
-
-    # -------------------------------------------------------------------------
-    # STEP 4: Create plaintext version of the email
-    # -------------------------------------------------------------------------
-    
-    # This is the simple text version for email clients that don't support HTML
-    # Triple quotes (""") allow multi-line strings in Python
-    text = f"""GitHub Streak Monitor - Daily Status
-
-Date: {date_str}
-Status: {status}
-{status_text}
-
-{body_text}
 
-Check Window: 00:01 - 18:30 (Australian Eastern Time)
-
-{footer}
-"""
+    # Imported here rather than at the top of the file, see the note next to the imports
+    import smtplib
 
     # -------------------------------------------------------------------------
-    # STEP 5: Create HTML version of the email
+    # STEP 1-6: Build the email, or reuse it if we already built the same one
     # -------------------------------------------------------------------------
-    
-    # This is the fancy formatted version with colors and styling
-    # Most modern email clients will display this version
-    html = f"""
-<html>
-<body>
-<h2>GitHub Streak Monitor - Daily Status</h2>
-<p><strong>Date:</strong> {date_str}</p>
-<p><strong>Status:</strong> <span style="color: {status_color}; font-weight: bold;">{status}</span></p>
-<p><strong>{status_text}</strong></p>
-<hr>
-<p>{body_text}</p>
-<p><strong>Check Window:</strong> 00:01 - 18:30 (Australian Eastern Time)</p>
-<p><em>{footer}</em></p>
-</body>
-</html>
-"""
 
-    # -------------------------------------------------------------------------
-    # STEP 6: Attach both versions to the email
-    # -------------------------------------------------------------------------
-    
-    # MIMEText creates a text block that can be attached to an email
-    # The second argument specifies the content type
-    message.attach(MIMEText(text, "plain"))  # Plaintext version
-    message.attach(MIMEText(html, "html"))   # HTML version
+    cache_key = (sender, recipient, has_commit, date_str)
+    payload = _MIME_CACHE.get(cache_key)
+    if payload is None:
+        payload = _build_message(sender, recipient, has_commit, date_str)
+        _MIME_CACHE[cache_key] = payload
+        # Only keep the last week's worth, dropping the oldest first
+        if len(_MIME_CACHE) > 7:
+            _MIME_CACHE.popitem(last=False)
 
     # -------------------------------------------------------------------------
     # STEP 7: Connect to SMTP server and send the email
     # -------------------------------------------------------------------------
     
-    # 'with' statement ensures the connection is properly closed when done
-    # smtplib.SMTP() opens a connection to the mail server
-    with smtplib.SMTP(smtp_server, int(smtp_port)) as server:
-        
-        # starttls() upgrades the connection to use encryption (TLS)
-        # This is important for security - it encrypts your password and email
-        server.starttls()
-        
-        # login() authenticates with your email and password
-        # For Gmail, you MUST use an "App Password" (not your regular password)
-        server.login(sender, password)
-        
-        # sendmail() actually sends the email
-        # message.as_string() converts our MIME message to the format SMTP expects
-        server.sendmail(sender, recipient, message.as_string())
+    # Reuse the cached connection if it's still alive (no 'with' block, so it stays open for the next warm invocation)
+    server = _get_smtp(smtp_server, smtp_port, sender, password)
+
+    try:
+        # sendmail() actually sends the email (it's happy to take the encoded bytes directly)
+        server.sendmail(sender, recipient, payload)
+    except smtplib.SMTPServerDisconnected:
+        # The server dropped us between the NOOP check and sendmail, so reconnect once and try again
+        server = _get_smtp(smtp_server, smtp_port, sender, password, reconnect=True)
+        server.sendmail(sender, recipient, payload)
 
     # Log that we successfully sent the email
-    logger.info(f"Email sent to {recipient}")
+    logger.info("Email sent to %s", recipient)
 
 
 # =============================================================================
@@ -408,8 +648,7 @@ def lambda_handler(event, context):
         # STEP 2: Get today's date in Australian time
         # ---------------------------------------------------------------------
         
-        aus_tz = pytz.timezone('Australia/Sydney')
-        today_aus = datetime.now(aus_tz).date()
+        today_aus = datetime.now(AUS_TZ).date()
         
         # Format the date as "2025-12-06" for use in email
         date_str = today_aus.strftime("%Y-%m-%d")
@@ -418,13 +657,13 @@ def lambda_handler(event, context):
         # STEP 3: Check if user made commits today
         # ---------------------------------------------------------------------
         
-        has_commit, commit_times = check_commits_today(username, token)
+        has_commit = check_commits_today(username, token)
 
         # ---------------------------------------------------------------------
         # STEP 4: Send status email
         # ---------------------------------------------------------------------
         
-        logger.info(f"Sending status email for {date_str}")
+        logger.info("Sending status email for %s", date_str)
 
         try:
             send_email(
@@ -435,12 +674,11 @@ def lambda_handler(event, context):
                 get_env("SENDER_PASSWORD"),
                 get_env("RECIPIENT_EMAIL"),
                 has_commit,
-                commit_times,
                 date_str
             )
         except Exception as e:
             # If email fails, log the error and return a 500 error
-            logger.error(f"Email failed: {e}")
+            logger.error("Email failed: %s", e)
             return {"statusCode": 500, "body": f"Email failed: {e}"}
 
         # ---------------------------------------------------------------------
@@ -455,5 +693,5 @@ def lambda_handler(event, context):
 
     except Exception as e:
         # Catch any unexpected errors and return a 500 error
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         return {"statusCode": 500, "body": str(e)}
@@ -10,7 +10,9 @@ mkdir package
 
 # Install dependencies
 echo "Installing dependencies..."
-pip install -r requirements.txt -t package/
+# orjson is compiled, so ask pip for the wheel that matches Lambda (Linux x86_64, Python 3.11)
+# rather than whatever matches this machine
+pip install -r requirements.txt -t package/ --platform manylinux2014_x86_64 --python-version 3.11 --implementation cp --only-binary=:all:
 
 # Copy Lambda function
 cp lambda_function.py package/